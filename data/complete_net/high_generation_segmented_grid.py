@@ -25,28 +25,29 @@ class HighGenSegmentedNet:
 
         p_gens = exp / exp.sum() * self.total_p_gen
         q_gens = exp / exp.sum() * self.total_q_gen
-        resistances = [1.0 / N_SEGMENTS] * N_SEGMENTS
+        resistances = np.full(N_SEGMENTS, 1.0 / N_SEGMENTS)
 
         pp.create_bus(self.net, vn_kv=10.0, index=0)
 
-        from_bus = 0
-        for segment, resistance, segment_p_gen, segment_q_gen in zip(range(N_SEGMENTS), resistances, p_gens, q_gens):
-            to_bus = pp.create_bus(self.net, vn_kv=10.0)
-            pp.create_line_from_parameters(
-                self.net,
-                from_bus=from_bus,
-                to_bus=to_bus,
-                length_km=1.0,
-                r_ohm_per_km=resistance,
-                x_ohm_per_km=0.00001,
-                c_nf_per_km=0.0,
-                g_us_per_km=0.0,
-                max_i_ka=100.0,
-            )
-            pp.create_sgen(self.net, bus=to_bus, p_mw=segment_p_gen, q_mvar=segment_q_gen)
-            from_bus = to_bus
+        # segment i runs from bus i to bus i + 1
+        to_buses = np.arange(1, N_SEGMENTS + 1)
+        from_buses = to_buses - 1
+        pp.create_buses(self.net, nr_buses=N_SEGMENTS, vn_kv=10.0, index=to_buses)
+        pp.create_lines_from_parameters(
+            self.net,
+            from_buses=from_buses,
+            to_buses=to_buses,
+            length_km=1.0,
+            r_ohm_per_km=resistances,
+            x_ohm_per_km=0.00001,
+            c_nf_per_km=0.0,
+            g_us_per_km=0.0,
+            max_i_ka=100.0,
+        )
+        pp.create_sgens(self.net, buses=to_buses, p_mw=p_gens, q_mvar=q_gens)
+        self.net.sgen = self.net.sgen.drop(columns="generator_type")  # only added by create_sgens, not create_sgen
 
-        pp.create_sgen(self.net, bus=to_bus, p_mw=self.p_mw, q_mvar=170.0)  # parametric p_mw, q_mvar
+        pp.create_sgen(self.net, bus=to_buses[-1], p_mw=self.p_mw, q_mvar=170.0)  # parametric p_mw, q_mvar
         pp.create_ext_grid(self.net, bus=0, vm_pu=self.vm_pu, va_degree=0.0)  # parametrize vm_pu
 
     def run_power_flow(self, init_vm_pu=None):
@@ -0,0 +1,563 @@
+import multiprocessing as mp
+import pickle
+import warnings
+from functools import partial
+
+import numpy as np
+import pandapower as pp
+import torch
+from numba import njit
+from pandapower.pypower.idx_bus import VA, VM
+from torch.utils.data import Dataset
+from tqdm import tqdm
+
+VM_PU_RANGE = [0.9, 1.1]  #
+P_MW_RANGE = [0.0, 0.2]  #
+Q_MVAR_RANGE = [0.0, 0.1]  #
+G_RANGE = [80, 120]  #
+B_RANGE = [0.01, 0.2]  #
+INIT_VM_PU_MIN = 0.9  #
+INIT_VM_PU_MAX = 1.1  #
+INIT_THETA_MIN = -1
+INIT_THETA_MAX = 1
+SAMPLES_PER_GRID = 10
+
+# order of the sample arrays within a flattened dataset row
+FEATURE_KEYS = ["P", "Q", "G_data", "B_data", "V_init", "theta_init", "V_pred", "Phi_pred", "resd_real", "resd_imag"]
+
+
+@njit(cache=True, fastmath=True)
+def _residual_csr(V, Y_data, Y_indices, Y_indptr, S):
+    # V * conj(Ybus @ V) - S for all but the slack bus 0, with Ybus given by its CSR arrays
+    n = V.shape[0]
+    residual = np.empty(n - 1, dtype=np.complex128)
+    for i in range(1, n):
+        current = 0j
+        for k in range(Y_indptr[i], Y_indptr[i + 1]):
+            current += Y_data[k] * V[Y_indices[k]]
+        residual[i - 1] = V[i] * np.conj(current) - S[i]
+    return residual
+
+
+# compile at import so neither the first sample nor each pool worker pays for it
+_residual_csr(
+    np.ones(2, dtype=np.complex128),
+    np.ones(1, dtype=np.complex128),
+    np.zeros(1, dtype=np.int32),
+    np.array([0, 1, 1], dtype=np.int32),
+    np.zeros(2, dtype=np.complex128),
+)
+
+
+def _dSbus_dV_batched(Ybus, V):
+    # partial derivatives of the bus injections w.r.t. voltage magnitude and angle, dense and per grid of the batch
+    Ibus = torch.einsum("bij,bj->bi", Ybus, V)
+    Vnorm = V / V.abs()
+    dS_dVm = V.unsqueeze(2) * torch.conj(Ybus * Vnorm.unsqueeze(1)) + torch.diag_embed(torch.conj(Ibus) * Vnorm)
+    dS_dVa = 1j * V.unsqueeze(2) * torch.conj(torch.diag_embed(Ibus) - Ybus * V.unsqueeze(1))
+    return dS_dVm, dS_dVa
+
+
+def batched_nr(Ybus, Sbus, V0, pv, pq, max_iteration=50, tolerance=1e-8):
+    """
+    Newton-Raphson power flow for a batch of equally sized grids, all iterations run on the whole batch.
+
+    Parameters:
+    Ybus (torch.Tensor): Complex bus admittance matrices, shape (B, N, N).
+    Sbus (torch.Tensor): Complex bus power injections in p.u., shape (B, N).
+    V0 (torch.Tensor): Complex initial bus voltages, shape (B, N).
+    pv (torch.Tensor): Indices of the PV buses.
+    pq (torch.Tensor): Indices of the PQ buses.
+    max_iteration (int): Maximum number of iterations.
+    tolerance (float): Limit on the largest power mismatch in p.u., as tolerance_mva in pandapower.
+
+    Returns:
+    tuple: Complex bus voltages (B, N), iterations (B,) and convergence flags (B,).
+    """
+    pvpq = torch.cat([pv, pq])
+    n_pvpq = len(pvpq)
+
+    def mismatch(V):
+        mis = V * torch.conj(torch.einsum("bij,bj->bi", Ybus, V)) - Sbus
+        return torch.cat([mis[:, pvpq].real, mis[:, pq].imag], dim=1)
+
+    Vm = V0.abs()
+    Va = V0.angle()
+    V = V0
+    F = mismatch(V)
+    converged = F.abs().amax(dim=1) < tolerance
+    iterations = torch.zeros(V0.shape[0], dtype=torch.int64, device=V0.device)
+
+    for _ in range(max_iteration):
+        if converged.all():
+            break
+        dS_dVm, dS_dVa = _dSbus_dV_batched(Ybus, V)
+        J = torch.cat(
+            [
+                torch.cat([dS_dVa[:, pvpq][:, :, pvpq].real, dS_dVm[:, pvpq][:, :, pq].real], dim=2),
+                torch.cat([dS_dVa[:, pq][:, :, pvpq].imag, dS_dVm[:, pq][:, :, pq].imag], dim=2),
+            ],
+            dim=1,
+        )
+        # solve_ex does not raise on the singular Jacobians of diverging grids
+        dx = -torch.linalg.solve_ex(J, F.unsqueeze(2))[0].squeeze(2)
+        dx[converged] = 0.0  # converged grids keep their solution
+
+        Va[:, pvpq] += dx[:, :n_pvpq]
+        Vm[:, pq] += dx[:, n_pvpq:]
+        V = Vm * torch.exp(1j * Va)
+        Vm = V.abs()  # as in pandapower's newtonpf, in case we wrapped around with a negative Vm
+        Va = V.angle()
+        iterations += ~converged
+
+        F = mismatch(V)
+        converged = converged | (F.abs().amax(dim=1) < tolerance)
+
+    return V, iterations, converged
+
+
+def _build_two_bus_template():
+    # Topology shared by every SimpleTwoBus, the instances only patch in their parameters
+    net = pp.create_empty_network()
+
+    # Create two buses with initialized voltage and angle
+    bus1, bus2 = pp.create_buses(net, nr_buses=2, vn_kv=[20.0, 0.4], name=["Bus 1", "Bus 2"], index=[0, 1])
+    net.bus["vm_pu"] = 1.0
+    net.bus["va_degree"] = 0.0
+
+    # create a line between the two buses
+    pp.create_line_from_parameters(
+        net,
+        from_bus=bus1,
+        to_bus=bus2,
+        length_km=1.0,
+        r_ohm_per_km=1.0,
+        x_ohm_per_km=1.0,
+        c_nf_per_km=0.0,
+        g_us_per_km=0.0,
+        max_i_ka=100.0,
+    )
+
+    # Create a load at bus 2
+    pp.create_load(net, bus2, p_mw=0.0, q_mvar=0.0, name="Load")
+
+    # Create an external grid connection at bus 1
+    pp.create_ext_grid(net, bus1, vm_pu=1.0, name="Grid Connection")
+    return net
+
+
+_TWO_BUS_TEMPLATE = _build_two_bus_template()
+
+
+class SimpleTwoBus:
+    def __init__(self, V_ext, P, Q, G, B, V_init, theta_init):
+        """This class creates a simple 2-bus network."""
+        self.V_ext = V_ext
+        self.P = P
+        self.Q = Q
+        self.G = G
+        self.B = B
+        self.V_init = V_init
+        self.theta_init = theta_init
+        self.create_two_bus_grid()
+
+    def create_two_bus_grid(self):
+        # Copying the template is cheaper than creating the elements one by one
+        self.net = _TWO_BUS_TEMPLATE.deepcopy()
+
+        # Initialize voltage and angle for buses
+        self.net.bus["vm_pu"] = np.asarray(self.V_init, dtype=float)
+        self.net.bus["va_degree"] = np.asarray(self.theta_init, dtype=float)
+
+        # line between the two buses
+        self.net.line.at[0, "r_ohm_per_km"] = 1 / self.G
+        self.net.line.at[0, "x_ohm_per_km"] = 1 / self.B
+
+        # load at bus 2 with specified P and Q
+        self.net.load.at[0, "p_mw"] = self.P
+        self.net.load.at[0, "q_mvar"] = self.Q
+
+        # external grid connection at bus 1
+        self.net.ext_grid.at[0, "vm_pu"] = self.V_ext
+
+
+class PowerFlowDataset(Dataset):
+    def __init__(
+        self,
+        base_network,
+        num_samples=1000,
+        max_iteration=50,
+        tolerance_mva=1e-8,
+        v_perturb=0.15,
+        theta_perturb=30,
+        rng=None,
+        solver="pandapower",
+        device="cpu",
+        validate_samples=3,
+    ):
+        """
+        Initialize the dataset with a base network and number of samples.
+
+        Parameters:
+        base_network (pandapowerNet): The base pandapower network.
+        num_samples (int): Number of samples to generate.
+        rng (np.random.Generator): Random generator used for the perturbations, a fresh one if None.
+        solver (str): "pandapower" runs one power flow per sample, "torch" solves all samples at once with batched_nr.
+        device (str): Torch device of the "torch" solver.
+        validate_samples (int): Number of random "torch" samples that are re-solved with pandapower as a check.
+        """
+        self.base_net = base_network.deepcopy()  # Ensure base network is not modified
+        self.num_samples = num_samples
+        self.samples = []
+        self.max_iteration = max_iteration
+        self.tolerance_mva = tolerance_mva
+        self.v_perturb = v_perturb
+        self.theta_perturb = theta_perturb
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.solver = solver
+        self.device = device
+        self.validate_samples = validate_samples
+        self.Y_row = None  # Ybus sparsity pattern, shared by all samples
+        self.Y_col = None
+
+        self.generate_samples()
+
+        # Flattened float32 rows of all samples, _X/_Y are tensor views on them and __getitem__ only slices
+        self._rows = _flatten_samples(self.samples)
+        self._X = torch.from_numpy(self._rows)[:, :-1]
+        self._Y = torch.from_numpy(self._rows)[:, -1]
+
+    def compute_residual(self, V, Ybus, S):
+        Ybus = Ybus.tocsr()  # no copy for the CSR matrix stored by pandapower
+        return _residual_csr(V, Ybus.data, Ybus.indices, Ybus.indptr, S)
+
+    def generate_samples(self):
+        """
+        Generate samples by first running normal power flow and then perturbing it to create ill-conditioning.
+        """
+        # Run a normal power flow first
+        net = self.base_net.deepcopy()
+        try:
+            pp.runpp(net, max_iteration=100, numba=True, lightsim2grid="auto")  # Solve with standard conditions
+
+            # Only the initialization changes between samples, so a single working copy is reused and its
+            # ppc and Ybus are recycled. The recycled runs keep the options (max_iteration, tolerance_mva,
+            # numba, lightsim2grid, only_v_results) of this warm run. With only_v_results they leave the
+            # solution in the ppc and skip building the res_* tables.
+            net_ill = net.deepcopy()
+            pp.runpp(
+                net_ill,
+                init="results",
+                max_iteration=self.max_iteration,
+                tolerance_mva=self.tolerance_mva,
+                numba=True,
+                lightsim2grid="auto",
+                only_v_results=True,
+            )
+        except pp.powerflow.LoadflowNotConverged:
+            return
+
+        # Extract the normal solution
+        v_nominal = net.res_bus.vm_pu.values  # Nominal voltage magnitudes
+        theta_nominal = net.res_bus.va_degree.values  # Nominal voltage angles
+
+        # The topology is the same for every sample, so the (row, col) of the Ybus nonzeros are kept once
+        Ybus_coo = net_ill._ppc["internal"]["Ybus"].tocoo()
+        self.Y_row = Ybus_coo.row.astype(np.int32)
+        self.Y_col = Ybus_coo.col.astype(np.int32)
+
+        # A recycled run starts from the voltages in the ppc bus table, the slack buses keep their set point
+        bus_rows = net_ill._pd2ppc_lookups["bus"][net_ill.bus.index.values]
+        is_free = ~np.isin(net_ill.bus.index.values, net_ill.ext_grid.bus.values)
+        init_rows = bus_rows[is_free]
+
+        if self.solver == "torch":
+            self.generate_samples_batched(net_ill, v_nominal, theta_nominal, bus_rows, is_free)
+            return
+
+        for _ in range(self.num_samples):
+            v_ill, theta_ill = self.perturb(v_nominal, theta_nominal)
+
+            try:
+                # Re-run power flow with ill-conditioned initialization
+                self.run_ill_conditioned(net_ill, v_ill, theta_ill, init_rows, is_free)
+
+                # Extract ill-conditioned solution
+                ppci = net_ill._ppc["internal"]
+                it = net_ill._ppc["iterations"]
+                V_mag = net_ill._ppc["bus"][bus_rows, VM]
+                V_ang = net_ill._ppc["bus"][bus_rows, VA]
+                self.add_sample(ppci["Ybus"], ppci["Sbus"], ppci["V"], v_ill, theta_ill, it, V_mag, V_ang)
+
+            except pp.powerflow.LoadflowNotConverged:
+                print(f"Sample {_}: Ill-conditioned case did not converge!")
+
+    def run_ill_conditioned(self, net_ill, v_ill, theta_ill, init_rows, is_free):
+        """
+        Recycled pandapower run of net_ill from one ill-conditioned initialization.
+
+        Parameters:
+        net_ill (pandapowerNet): Network with a converged power flow whose ppc is reused.
+        v_ill (np.ndarray): Initial voltage magnitudes.
+        theta_ill (np.ndarray): Initial voltage angles in degree.
+        init_rows (np.ndarray): ppc rows of the buses whose initial voltage is perturbed.
+        is_free (np.ndarray): Mask of the buses whose initial voltage is perturbed.
+        """
+        # the init_* arguments only take effect if pandapower falls back to a full run
+        net_ill._ppc["bus"][init_rows, VM] = v_ill[is_free]
+        net_ill._ppc["bus"][init_rows, VA] = theta_ill[is_free]
+        pp.runpp(
+            net_ill,
+            init="auto",
+            init_vm_pu=v_ill,
+            init_va_degree=theta_ill,
+            max_iteration=self.max_iteration,
+            tolerance_mva=self.tolerance_mva,
+            numba=True,
+            lightsim2grid="auto",
+            only_v_results=True,
+            recycle={"bus_pq": False, "trafo": False, "gen": False},
+        )
+        if not net_ill._ppc["success"]:  # recycled runs with only_v_results do not raise themselves
+            raise pp.powerflow.LoadflowNotConverged()
+
+    def generate_samples_batched(self, net_ill, v_nominal, theta_nominal, bus_rows, is_free):
+        """
+        Solve all ill-conditioned cases together with batched_nr instead of one pandapower run per sample.
+
+        Dense LU in torch and pandapower's solver round differently, so on near-singular starts the iteration
+        labels can differ by +-1 from pandapower's and a case can converge with one solver only. The validated
+        cases that disagree are warned about and stored with pandapower's result.
+
+        Parameters:
+        net_ill (pandapowerNet): Network with a converged power flow, its ppc provides Ybus, Sbus and the bus types.
+        v_nominal (np.ndarray): Nominal voltage magnitudes.
+        theta_nominal (np.ndarray): Nominal voltage angles in degree.
+        bus_rows (np.ndarray): ppc row of every pandapower bus.
+        is_free (np.ndarray): Mask of the buses whose initial voltage is perturbed.
+        """
+        ppci = net_ill._ppc["internal"]
+        Ybus = ppci["Ybus"]
+        S = ppci["Sbus"]
+        perturbed = [self.perturb(v_nominal, theta_nominal) for _ in range(self.num_samples)]
+        v_ill = np.array([v for v, _ in perturbed])
+        theta_ill = np.array([theta for _, theta in perturbed])
+
+        # Same start as a recycled pandapower run: slack buses at their set point, PV buses at their set point
+        # magnitude and the remaining buses at the perturbed voltages
+        V0 = np.tile(ppci["V"], (self.num_samples, 1))
+        V0[:, bus_rows[is_free]] = v_ill[:, is_free] * np.exp(1j * np.deg2rad(theta_ill[:, is_free]))
+        pv = ppci["pv"]
+        V0[:, pv] *= np.abs(ppci["V"][pv]) / np.abs(V0[:, pv])
+
+        V, iterations, converged = batched_nr(
+            torch.as_tensor(Ybus.toarray(), device=self.device).expand(self.num_samples, -1, -1),
+            torch.as_tensor(S, device=self.device).expand(self.num_samples, -1),
+            torch.as_tensor(V0, device=self.device),
+            torch.as_tensor(pv, device=self.device),
+            torch.as_tensor(ppci["pq"], device=self.device),
+            max_iteration=self.max_iteration,
+            tolerance=self.tolerance_mva,
+        )
+        V = V.cpu().numpy()
+        iterations = iterations.cpu().numpy()
+        converged = converged.cpu().numpy()
+
+        # pandapower stays the reference, a few random cases are solved again with it
+        for i in self.rng.choice(self.num_samples, min(self.validate_samples, self.num_samples), replace=False):
+            try:
+                self.run_ill_conditioned(net_ill, v_ill[i], theta_ill[i], bus_rows[is_free], is_free)
+                pp_converged, pp_iterations = True, net_ill._ppc["iterations"]
+            except pp.powerflow.LoadflowNotConverged:
+                pp_converged, pp_iterations = False, None
+            if pp_converged != converged[i] or (
+                pp_converged
+                and (pp_iterations != iterations[i] or not np.allclose(net_ill._ppc["internal"]["V"], V[i]))
+            ):
+                warnings.warn(f"Sample {i}: batched_nr does not match the pandapower power flow, keeping pandapower's")
+                converged[i] = pp_converged
+                if pp_converged:
+                    iterations[i] = pp_iterations
+                    V[i] = net_ill._ppc["internal"]["V"]
+
+        V_bus = V[:, bus_rows]
+        for i in range(self.num_samples):
+            if not converged[i]:
+                print(f"Sample {i}: Ill-conditioned case did not converge!")
+                continue
+            self.add_sample(
+                Ybus,
+                S,
+                V[i],
+                v_ill[i],
+                theta_ill[i],
+                int(iterations[i]),
+                np.abs(V_bus[i]),
+                np.angle(V_bus[i], deg=True),
+            )
+
+    def perturb(self, v_nominal, theta_nominal):
+        """
+        Draw the initial voltages of one ill-conditioned case.
+
+        Parameters:
+        v_nominal (np.ndarray): Nominal voltage magnitudes.
+        theta_nominal (np.ndarray): Nominal voltage angles in degree.
+
+        Returns:
+        tuple: Perturbed voltage magnitudes and angles.
+        """
+        v_ill = v_nominal + self.rng.uniform(-self.v_perturb, self.v_perturb, len(v_nominal))  # Small perturbation
+        theta_ill = theta_nominal + self.rng.uniform(
+            -self.theta_perturb, self.theta_perturb, len(theta_nominal)
+        )  # Large phase shift
+        return v_ill, theta_ill
+
+    def add_sample(self, Ybus, S, V, v_ill, theta_ill, iterations, V_mag, V_ang):
+        """
+        Store one converged ill-conditioned case.
+
+        Parameters:
+        Ybus (scipy.sparse.csr_matrix): Bus admittance matrix.
+        S (np.ndarray): Complex bus power injections.
+        V (np.ndarray): Converged complex bus voltages in the order of Ybus.
+        v_ill (np.ndarray): Initial voltage magnitudes.
+        theta_ill (np.ndarray): Initial voltage angles in degree.
+        iterations (int): Newton-Raphson iterations until convergence.
+        V_mag (np.ndarray): Solution voltage magnitudes.
+        V_ang (np.ndarray): Solution voltage angles in degree.
+        """
+        Ybus_coo = Ybus.tocoo()  # only the nonzero admittances are stored, ordered as Y_row/Y_col
+        resd = self.compute_residual(V, Ybus, S)  # from the solver's own voltages, no rebuild from V_mag/V_ang
+
+        # float32 is plenty for the training features and halves the memory of the samples
+        self.samples.append(
+            {
+                "P": S.real.astype(np.float32, copy=False),
+                "Q": S.imag.astype(np.float32, copy=False),
+                "G_data": Ybus_coo.data.real.astype(np.float32, copy=False),
+                "B_data": Ybus_coo.data.imag.astype(np.float32, copy=False),
+                "V_init": v_ill.astype(np.float32, copy=False),
+                "theta_init": theta_ill.astype(np.float32, copy=False),
+                "iterations": iterations,
+                "V_pred": V_mag.astype(np.float32, copy=False),
+                "Phi_pred": V_ang.astype(np.float32, copy=False),
+                "resd_real": resd.real.astype(np.float32, copy=False),
+                "resd_imag": resd.imag.astype(np.float32, copy=False),
+            }
+        )
+
+    def save(self, path="data.pkl"):
+        """
+        Pickle the generated samples together with the Ybus (row, col) indices of their G_data/B_data.
+
+        Parameters:
+        path (str): Output file.
+        """
+        with open(path, "wb") as f:
+            pickle.dump(
+                {"samples": self.samples, "Y_row": self.Y_row, "Y_col": self.Y_col},
+                f,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+
+    def __len__(self):
+        return len(self.samples)
+
+    def __getitem__(self, idx):
+        return {"input": self._X[idx], "output": self._Y[idx]}
+
+
+def _init_worker():
+    # compile pandapower's numba kernels and load lightsim2grid once per worker instead of inside the first grid
+    pp.runpp(SimpleTwoBus(1.0, 0.1, 0.05, 100, 0.1, [1.0, 1.0], [0, 0]).net, numba=True, lightsim2grid="auto")
+
+
+def _generate_one_grid(seed, solver="pandapower"):
+    # every worker needs its own generator, forked processes would otherwise draw identical grids
+    rng = np.random.default_rng(seed)
+
+    V_ext = rng.uniform(VM_PU_RANGE[0], VM_PU_RANGE[1])
+    P = rng.uniform(P_MW_RANGE[0], P_MW_RANGE[1])
+    Q = rng.uniform(Q_MVAR_RANGE[0], Q_MVAR_RANGE[1])
+    G = rng.uniform(G_RANGE[0], G_RANGE[1])  # Short-circuit power in MVA
+    B = rng.uniform(B_RANGE[0], B_RANGE[1])  # Short-circuit impedance
+
+    V_init = [
+        rng.uniform(INIT_VM_PU_MIN, INIT_VM_PU_MAX),
+        rng.uniform(INIT_VM_PU_MIN, INIT_VM_PU_MAX),
+    ]
+    theta_init = [
+        rng.uniform(INIT_THETA_MIN, INIT_THETA_MAX),
+        rng.uniform(INIT_THETA_MIN, INIT_THETA_MAX),
+    ]
+
+    Net = SimpleTwoBus(V_ext, P, Q, G, B, V_init, theta_init)
+    net = Net.net
+    PF_data = PowerFlowDataset(
+        net,
+        num_samples=SAMPLES_PER_GRID,
+        max_iteration=50,
+        tolerance_mva=1e-5,
+        v_perturb=0.15,
+        theta_perturb=30,
+        rng=rng,
+        solver=solver,
+    )
+
+    return PF_data._rows
+
+
+def _flatten_samples(samples):
+    # one row per sample: the FEATURE_KEYS arrays back to back, followed by the iteration count
+    if not samples:
+        return np.empty((0, 1), dtype=np.float32)
+    lengths = [len(samples[0][key]) for key in FEATURE_KEYS]
+    rows = np.empty((len(samples), sum(lengths) + 1), dtype=np.float32)
+    for i, d in enumerate(samples):
+        start = 0
+        for key, length in zip(FEATURE_KEYS, lengths):
+            rows[i, start : start + length] = d[key]
+            start += length
+        rows[i, -1] = d["iterations"]
+    return rows
+
+
+def create_grid_dataset(grid_num=100, processes=None, seed=None, solver="pandapower"):
+    """
+    Generate the flattened samples of `grid_num` random 2-bus grids, spread over a pool of worker processes.
+
+    Parameters:
+    grid_num (int): Number of random grids.
+    processes (int): Number of worker processes, os.cpu_count() if None.
+    seed (int): Root seed of the per-grid generators, fresh entropy if None. The rows are kept in grid order, so a
+        seed reproduces the whole array.
+    solver (str): Power flow solver of the grids, see PowerFlowDataset. The workers run the "torch" solver on CPU.
+
+    Returns:
+    np.ndarray: One row per converged sample, the last column holds the iterations.
+    """
+    seeds = np.random.SeedSequence(seed).spawn(grid_num)
+
+    data_array = None
+    n_rows = 0
+    with mp.Pool(processes=processes, initializer=_init_worker) as pool:
+        # imap instead of imap_unordered, the grids are cheap and alike, so waiting for the order costs next to nothing
+        for rows in tqdm(pool.imap(partial(_generate_one_grid, solver=solver), seeds, chunksize=4), total=grid_num):
+            if not len(rows):
+                continue
+            if data_array is None:
+                data_array = np.empty((grid_num * SAMPLES_PER_GRID, rows.shape[1]), dtype=np.float32)
+            data_array[n_rows : n_rows + len(rows)] = rows
+            n_rows += len(rows)
+
+    if data_array is None:
+        return np.empty((0, 0), dtype=np.float32)
+    return data_array[:n_rows]
+
+
+if __name__ == "__main__":
+    data_array = create_grid_dataset(100)
+    # Display shape of the array
+    print(data_array.shape)
+    np.save("vector_data.npy", data_array)